@@ -233,6 +233,21 @@ class MCPToolDefinitions:
                         "description": "Maximum traversal depth",
                         "default": 5,
                     },
+                    "include_sizes": {
+                        "type": "boolean",
+                        "description": "Whether to include file sizes (false skips per-file stat calls)",
+                        "default": True,
+                    },
+                    "include_empty_files": {
+                        "type": "boolean",
+                        "description": "Whether to also return the paths of zero-byte files as empty_files",
+                        "default": False,
+                    },
+                    "ignore_dirs": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Directory names to skip (defaults to VCS, cache and dependency directories such as node_modules)",
+                    },
                 },
             },
         }
@@ -13,16 +13,26 @@ python tools/code_implementation_server.py
 """
 
 import os
+import stat
+import asyncio
 import subprocess
+import threading
 import json
 import sys
+import functools
+import collections
 import io
+import concurrent.futures
+import itertools
+import fnmatch
+import glob
 from pathlib import Path
 import re
 from typing import Dict, Any, List
 import tempfile
 import shutil
 import logging
+import time
 from datetime import datetime
 
 # Set standard output encoding to UTF-8
@@ -40,6 +50,14 @@ if sys.stdout.encoding != "utf-8":
 # Import MCP related modules
 from mcp.server.fastmcp import FastMCP
 
+# Optional fast JSON encoder for tool responses
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -47,9 +65,12 @@ logger = logging.getLogger(__name__)
 # Create FastMCP server instance
 mcp = FastMCP("code-implementation-server")
 
+# Maximum number of operations kept in memory
+MAX_OPERATION_HISTORY = 10000
+
 # Global variables: workspace directory and operation history
 WORKSPACE_DIR = None
-OPERATION_HISTORY = []
+OPERATION_HISTORY = collections.deque(maxlen=MAX_OPERATION_HISTORY)
 CURRENT_FILES = {}
 
 
@@ -100,13 +121,193 @@ def validate_path(path: str) -> Path:
     return full_path
 
 
+# Timestamp cache: (unix second, ISO string) of the last formatted time
+_TIMESTAMP_CACHE = (None, "")
+
+
+def _now_iso() -> str:
+    """Current local time as an ISO string, re-formatted at most once per second"""
+    global _TIMESTAMP_CACHE
+    now = int(time.time())
+    if _TIMESTAMP_CACHE[0] != now:
+        _TIMESTAMP_CACHE = (
+            now,
+            datetime.fromtimestamp(now).isoformat(timespec="seconds"),
+        )
+    return _TIMESTAMP_CACHE[1]
+
+
 def log_operation(action: str, details: Dict[str, Any]):
     """Log operation history"""
     OPERATION_HISTORY.append(
-        {"timestamp": datetime.now().isoformat(), "action": action, "details": details}
+        {"timestamp": _now_iso(), "action": action, "details": details}
     )
 
 
+def _dumps(data: Any) -> str:
+    """Serialize a tool response as indented JSON, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(
+                data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ).decode("utf-8")
+        except TypeError:
+            # orjson rejects a few values json accepts (e.g. lone surrogates)
+            pass
+    return json.dumps(data, ensure_ascii=False, indent=2)
+
+
+def _read_workspace_file_lines(file_path: str):
+    """Read all lines of a workspace file, returning None if it does not exist"""
+    full_path = validate_path(file_path)
+    if not full_path.exists():
+        return None
+
+    with open(full_path, "r", encoding="utf-8") as f:
+        return f.readlines()
+
+
+def _create_backup(full_path: Path) -> bool:
+    """
+    Back up an existing file before it is overwritten
+
+    The backup is a hard link to the current file, so no data is copied.
+    Linking is only used when the file has no other links, is owned by our
+    user and group and is writable, so the replacement written by
+    _replace_file can keep the same owner; otherwise (or when hard links are
+    not supported, e.g. on FAT filesystems, or the link cannot be put in
+    place) the backup is a shutil.copy2 copy.
+
+    Returns:
+        True if the backup shares the file's inode, in which case the new
+        content must be written with _replace_file rather than in place
+    """
+    backup_path = full_path.with_suffix(full_path.suffix + ".backup")
+    # A backup still linked to the file (left by a failed write) holds the
+    # current content already; drop it so it is not counted as another link
+    if backup_path.exists() and os.path.samefile(full_path, backup_path):
+        backup_path.unlink()
+    st = full_path.stat()
+    if (
+        hasattr(os, "geteuid")
+        and st.st_nlink == 1
+        and st.st_uid == os.geteuid()
+        and st.st_gid == os.getegid()
+        and st.st_mode & stat.S_IWUSR
+    ):
+        # Link under a temporary name first so an existing backup is only
+        # replaced once the new one exists. The thread id keeps concurrent
+        # writers in this process (e.g. a batch worker and write_file on the
+        # event loop) from sharing the name
+        link_path = backup_path.with_name(
+            f".{backup_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        try:
+            if link_path.exists() or link_path.is_symlink():
+                link_path.unlink()
+            os.link(full_path, link_path)
+            os.replace(link_path, backup_path)
+            return True
+        except OSError:
+            # e.g. "<file>.backup" is a directory; copy2 copies into it
+            try:
+                link_path.unlink()
+            except FileNotFoundError:
+                pass
+
+    shutil.copy2(full_path, backup_path)
+    return False
+
+
+def _replace_file(full_path: Path, payload: bytes):
+    """
+    Write payload to a temporary file next to full_path and move it into place
+
+    Used when full_path is hard-linked to its backup: the old inode keeps the
+    backed-up content, and a failed write leaves the original untouched.
+    Mode, flags, extended attributes (including ACLs) and the group are
+    carried over from the file being replaced; _create_backup only links
+    files owned by the current user, so the owner already matches.
+    """
+    st = full_path.stat()
+    fd, temp_path = tempfile.mkstemp(
+        dir=full_path.parent, prefix=f".{full_path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            # A setgid directory hands new files its own group
+            if os.fstat(f.fileno()).st_gid != st.st_gid:
+                os.chown(temp_path, -1, st.st_gid)
+            shutil.copystat(full_path, temp_path)
+            f.write(payload)
+        # copystat also copied the old timestamps, which an empty write
+        # would leave in place
+        os.utime(temp_path)
+        os.replace(temp_path, full_path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def _write_workspace_file(
+    full_path: Path, content: str, create_dirs: bool, create_backup: bool
+):
+    """
+    Write content to an already validated workspace path
+
+    Returns:
+        (size_bytes, lines_count, backup_created) tuple
+    """
+    # Encode once and reuse the bytes for writing and metrics
+    payload = content.encode("utf-8")
+
+    # Create directories (if needed)
+    if create_dirs:
+        full_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Backup existing file (only when explicitly requested)
+    backup_created = False
+    backup_linked = False
+    if full_path.exists() and create_backup:
+        backup_linked = _create_backup(full_path)
+        backup_created = True
+
+    # Write file
+    if backup_linked:
+        _replace_file(full_path, payload)
+    else:
+        with open(full_path, "wb") as f:
+            f.write(payload)
+
+    return len(payload), payload.count(b"\n") + 1, backup_created
+
+
+def _write_workspace_files(
+    entries: List[tuple], create_dirs: bool, create_backup: bool
+):
+    """
+    Write (file_path, full_path, content) entries one after another
+
+    Returns:
+        List of (file_path, outcome) pairs, where outcome is the
+        _write_workspace_file result or the exception that was raised
+    """
+    outcomes = []
+    for file_path, full_path, content in entries:
+        try:
+            outcomes.append(
+                (
+                    file_path,
+                    _write_workspace_file(
+                        full_path, content, create_dirs, create_backup
+                    ),
+                )
+            )
+        except Exception as e:
+            outcomes.append((file_path, e))
+    return outcomes
+
+
 # ==================== File Operation Tools ====================
 
 
@@ -133,24 +334,30 @@ async def read_file(
             log_operation(
                 "read_file_error", {"file_path": file_path, "error": "file_not_found"}
             )
-            return json.dumps(result, ensure_ascii=False, indent=2)
+            return _dumps(result)
 
         with open(full_path, "r", encoding="utf-8") as f:
-            lines = f.readlines()
-
-        # 处理行号范围
-        if start_line is not None or end_line is not None:
-            start_idx = (start_line - 1) if start_line else 0
-            end_idx = end_line if end_line else len(lines)
-            lines = lines[start_idx:end_idx]
+            # 处理行号范围
+            if start_line is not None or end_line is not None:
+                start_idx = (start_line - 1) if start_line else 0
+                end_idx = end_line if end_line else None
+                if start_idx >= 0 and (end_idx is None or end_idx >= 0):
+                    # Stop reading once the requested range has been consumed
+                    content = "".join(itertools.islice(f, start_idx, end_idx))
+                else:
+                    content = "".join(f.readlines()[start_idx:end_idx])
+            else:
+                content = f.read()
 
-        content = "".join(lines)
+        lines_read = content.count("\n") + (
+            1 if content and not content.endswith("\n") else 0
+        )
 
         result = {
             "status": "success",
             "content": content,
             "file_path": file_path,
-            "total_lines": len(lines),
+            "total_lines": lines_read,
             "size_bytes": len(content.encode("utf-8")),
         }
 
@@ -160,11 +367,11 @@ async def read_file(
                 "file_path": file_path,
                 "start_line": start_line,
                 "end_line": end_line,
-                "lines_read": len(lines),
+                "lines_read": lines_read,
             },
         )
 
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        return _dumps(result)
 
     except Exception as e:
         result = {
@@ -173,7 +380,7 @@ async def read_file(
             "file_path": file_path,
         }
         log_operation("read_file_error", {"file_path": file_path, "error": str(e)})
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        return _dumps(result)
 
 
 @mcp.tool()
@@ -195,15 +402,13 @@ async def read_multiple_files(file_requests: str, max_files: int = 5) -> str:
         try:
             requests_data = json.loads(file_requests)
         except json.JSONDecodeError as e:
-            return json.dumps(
+            return _dumps(
                 {
                     "status": "error",
                     "message": f"Invalid JSON format for file_requests: {str(e)}",
                     "operation_type": "multi_file",
-                    "timestamp": datetime.now().isoformat(),
-                },
-                ensure_ascii=False,
-                indent=2,
+                    "timestamp": _now_iso(),
+                }
             )
 
         # Normalize requests format
@@ -213,40 +418,34 @@ async def read_multiple_files(file_requests: str, max_files: int = 5) -> str:
         elif isinstance(requests_data, dict):
             normalized_requests = requests_data
         else:
-            return json.dumps(
+            return _dumps(
                 {
                     "status": "error",
                     "message": "file_requests must be a JSON object or array",
                     "operation_type": "multi_file",
-                    "timestamp": datetime.now().isoformat(),
-                },
-                ensure_ascii=False,
-                indent=2,
+                    "timestamp": _now_iso(),
+                }
             )
 
         # Validate input
         if len(normalized_requests) == 0:
-            return json.dumps(
+            return _dumps(
                 {
                     "status": "error",
                     "message": "No files provided for reading",
                     "operation_type": "multi_file",
-                    "timestamp": datetime.now().isoformat(),
-                },
-                ensure_ascii=False,
-                indent=2,
+                    "timestamp": _now_iso(),
+                }
             )
 
         if len(normalized_requests) > max_files:
-            return json.dumps(
+            return _dumps(
                 {
                     "status": "error",
                     "message": f"Too many files provided ({len(normalized_requests)}), maximum is {max_files}",
                     "operation_type": "multi_file",
-                    "timestamp": datetime.now().isoformat(),
-                },
-                ensure_ascii=False,
-                indent=2,
+                    "timestamp": _now_iso(),
+                }
             )
 
         # Process each file
@@ -254,7 +453,7 @@ async def read_multiple_files(file_requests: str, max_files: int = 5) -> str:
             "status": "success",
             "message": f"Successfully processed {len(normalized_requests)} files",
             "operation_type": "multi_file",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now_iso(),
             "files_processed": len(normalized_requests),
             "files": {},
             "summary": {
@@ -266,14 +465,27 @@ async def read_multiple_files(file_requests: str, max_files: int = 5) -> str:
             },
         }
 
+        # Read all files concurrently so their I/O latency overlaps
+        read_outcomes = await asyncio.gather(
+            *(
+                asyncio.to_thread(_read_workspace_file_lines, file_path)
+                for file_path in normalized_requests
+            ),
+            return_exceptions=True,
+        )
+
         # Process each file individually
-        for file_path, options in normalized_requests.items():
+        for (file_path, options), lines in zip(
+            normalized_requests.items(), read_outcomes
+        ):
             try:
-                full_path = validate_path(file_path)
+                if isinstance(lines, Exception):
+                    raise lines
+
                 start_line = options.get("start_line")
                 end_line = options.get("end_line")
 
-                if not full_path.exists():
+                if lines is None:
                     results["files"][file_path] = {
                         "status": "error",
                         "message": f"File does not exist: {file_path}",
@@ -288,9 +500,6 @@ async def read_multiple_files(file_requests: str, max_files: int = 5) -> str:
                     results["summary"]["files_not_found"] += 1
                     continue
 
-                with open(full_path, "r", encoding="utf-8") as f:
-                    lines = f.readlines()
-
                 # Handle line range
                 original_line_count = len(lines)
                 if start_line is not None or end_line is not None:
@@ -385,18 +594,18 @@ async def read_multiple_files(file_requests: str, max_files: int = 5) -> str:
             },
         )
 
-        return json.dumps(results, ensure_ascii=False, indent=2)
+        return _dumps(results)
 
     except Exception as e:
         result = {
             "status": "error",
             "message": f"Failed to read multiple files: {str(e)}",
             "operation_type": "multi_file",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now_iso(),
             "files_processed": 0,
         }
         log_operation("read_multiple_files_error", {"error": str(e)})
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        return _dumps(result)
 
 
 @mcp.tool()
@@ -418,34 +627,23 @@ async def write_file(
     try:
         full_path = validate_path(file_path)
 
-        # Create directories (if needed)
-        if create_dirs:
-            full_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Backup existing file (only when explicitly requested)
-        backup_created = False
-        if full_path.exists() and create_backup:
-            backup_path = full_path.with_suffix(full_path.suffix + ".backup")
-            shutil.copy2(full_path, backup_path)
-            backup_created = True
-
-        # Write file
-        with open(full_path, "w", encoding="utf-8") as f:
-            f.write(content)
+        size_bytes, lines_count, backup_created = _write_workspace_file(
+            full_path, content, create_dirs, create_backup
+        )
 
         # Update current file record
         CURRENT_FILES[file_path] = {
-            "last_modified": datetime.now().isoformat(),
-            "size_bytes": len(content.encode("utf-8")),
-            "lines": len(content.split("\n")),
+            "last_modified": _now_iso(),
+            "size_bytes": size_bytes,
+            "lines": lines_count,
         }
 
         result = {
             "status": "success",
             "message": f"File written successfully: {file_path}",
             "file_path": file_path,
-            "size_bytes": len(content.encode("utf-8")),
-            "lines_written": len(content.split("\n")),
+            "size_bytes": size_bytes,
+            "lines_written": lines_count,
             "backup_created": backup_created,
         }
 
@@ -453,13 +651,13 @@ async def write_file(
             "write_file",
             {
                 "file_path": file_path,
-                "size_bytes": len(content.encode("utf-8")),
-                "lines": len(content.split("\n")),
+                "size_bytes": size_bytes,
+                "lines": lines_count,
                 "backup_created": backup_created,
             },
         )
 
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        return _dumps(result)
 
     except Exception as e:
         result = {
@@ -468,7 +666,7 @@ async def write_file(
             "file_path": file_path,
         }
         log_operation("write_file_error", {"file_path": file_path, "error": str(e)})
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        return _dumps(result)
 
 
 @mcp.tool()
@@ -496,52 +694,44 @@ async def write_multiple_files(
         try:
             files_dict = json.loads(file_implementations)
         except json.JSONDecodeError as e:
-            return json.dumps(
+            return _dumps(
                 {
                     "status": "error",
                     "message": f"Invalid JSON format for file_implementations: {str(e)}",
                     "operation_type": "multi_file",
-                    "timestamp": datetime.now().isoformat(),
-                },
-                ensure_ascii=False,
-                indent=2,
+                    "timestamp": _now_iso(),
+                }
             )
 
         # Validate input
         if not isinstance(files_dict, dict):
-            return json.dumps(
+            return _dumps(
                 {
                     "status": "error",
                     "message": "file_implementations must be a JSON object mapping file paths to content",
                     "operation_type": "multi_file",
-                    "timestamp": datetime.now().isoformat(),
-                },
-                ensure_ascii=False,
-                indent=2,
+                    "timestamp": _now_iso(),
+                }
             )
 
         if len(files_dict) == 0:
-            return json.dumps(
+            return _dumps(
                 {
                     "status": "error",
                     "message": "No files provided for writing",
                     "operation_type": "multi_file",
-                    "timestamp": datetime.now().isoformat(),
-                },
-                ensure_ascii=False,
-                indent=2,
+                    "timestamp": _now_iso(),
+                }
             )
 
         if len(files_dict) > max_files:
-            return json.dumps(
+            return _dumps(
                 {
                     "status": "error",
                     "message": f"Too many files provided ({len(files_dict)}), maximum is {max_files}",
                     "operation_type": "multi_file",
-                    "timestamp": datetime.now().isoformat(),
-                },
-                ensure_ascii=False,
-                indent=2,
+                    "timestamp": _now_iso(),
+                }
             )
 
         # Process each file
@@ -549,7 +739,7 @@ async def write_multiple_files(
             "status": "success",
             "message": f"Successfully processed {len(files_dict)} files",
             "operation_type": "multi_file",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now_iso(),
             "files_processed": len(files_dict),
             "files": {},
             "summary": {
@@ -561,34 +751,57 @@ async def write_multiple_files(
             },
         }
 
-        # Process each file individually
+        # Validate all paths
+        write_outcomes = {}
+        write_entries = []
         for file_path, content in files_dict.items():
             try:
                 full_path = validate_path(file_path)
+            except Exception as path_error:
+                write_outcomes[file_path] = path_error
+                continue
+            write_entries.append((file_path, full_path, content))
+
+        # Group entries that resolve to the same file. A batch is written as
+        # one group, in request order, when its writes can interact across
+        # targets: backups also touch "<file>.backup", which may itself be
+        # in the batch, and a target that is an ancestor of another (e.g.
+        # "a" and "a/b.py") decides whether the other's directory exists
+        write_groups = {}
+        for entry in write_entries:
+            write_groups.setdefault(entry[1], []).append(entry)
+        if create_backup or any(
+            parent in write_groups
+            for target in write_groups
+            for parent in target.parents
+        ):
+            write_groups = {None: write_entries}
 
-                # Create directories (if needed)
-                if create_dirs:
-                    full_path.parent.mkdir(parents=True, exist_ok=True)
-
-                # Backup existing file (only when explicitly requested)
-                backup_created = False
-                if full_path.exists() and create_backup:
-                    backup_path = full_path.with_suffix(full_path.suffix + ".backup")
-                    shutil.copy2(full_path, backup_path)
-                    backup_created = True
-                    results["summary"]["backups_created"] += 1
+        # Write distinct files concurrently; each group is written in order
+        for group_outcomes in await asyncio.gather(
+            *(
+                asyncio.to_thread(
+                    _write_workspace_files, entries, create_dirs, create_backup
+                )
+                for entries in write_groups.values()
+            )
+        ):
+            write_outcomes.update(group_outcomes)
 
-                # Write file
-                with open(full_path, "w", encoding="utf-8") as f:
-                    f.write(content)
+        # Process each file individually
+        for file_path in files_dict:
+            try:
+                outcome = write_outcomes[file_path]
+                if isinstance(outcome, Exception):
+                    raise outcome
 
-                # Calculate file metrics
-                size_bytes = len(content.encode("utf-8"))
-                lines_count = len(content.split("\n"))
+                size_bytes, lines_count, backup_created = outcome
+                if backup_created:
+                    results["summary"]["backups_created"] += 1
 
                 # Update current file record
                 CURRENT_FILES[file_path] = {
-                    "last_modified": datetime.now().isoformat(),
+                    "last_modified": _now_iso(),
                     "size_bytes": size_bytes,
                     "lines": lines_count,
                 }
@@ -666,18 +879,18 @@ async def write_multiple_files(
             },
         )
 
-        return json.dumps(results, ensure_ascii=False, indent=2)
+        return _dumps(results)
 
     except Exception as e:
         result = {
             "status": "error",
             "message": f"Failed to write multiple files: {str(e)}",
             "operation_type": "multi_file",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now_iso(),
             "files_processed": 0,
         }
         log_operation("write_multiple_files_error", {"error": str(e)})
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        return _dumps(result)
 
 
 # ==================== Code Execution Tools ====================
@@ -739,7 +952,7 @@ async def execute_python(code: str, timeout: int = 30) -> str:
                 },
             )
 
-            return json.dumps(execution_result, ensure_ascii=False, indent=2)
+            return _dumps(execution_result)
 
         finally:
             # Clean up temporary file
@@ -752,7 +965,7 @@ async def execute_python(code: str, timeout: int = 30) -> str:
             "timeout": timeout,
         }
         log_operation("execute_python_timeout", {"timeout": timeout})
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        return _dumps(result)
 
     except Exception as e:
         result = {
@@ -760,7 +973,7 @@ async def execute_python(code: str, timeout: int = 30) -> str:
             "message": f"Python code execution failed: {str(e)}",
         }
         log_operation("execute_python_error", {"error": str(e)})
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        return _dumps(result)
 
 
 @mcp.tool()
@@ -787,7 +1000,7 @@ async def execute_bash(command: str, timeout: int = 30) -> str:
                 "execute_bash_blocked",
                 {"command": command, "reason": "dangerous_command"},
             )
-            return json.dumps(result, ensure_ascii=False, indent=2)
+            return _dumps(result)
 
         # Ensure workspace directory exists
         ensure_workspace_exists()
@@ -827,7 +1040,7 @@ async def execute_bash(command: str, timeout: int = 30) -> str:
             },
         )
 
-        return json.dumps(execution_result, ensure_ascii=False, indent=2)
+        return _dumps(execution_result)
 
     except subprocess.TimeoutExpired:
         result = {
@@ -837,7 +1050,7 @@ async def execute_bash(command: str, timeout: int = 30) -> str:
             "timeout": timeout,
         }
         log_operation("execute_bash_timeout", {"command": command, "timeout": timeout})
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        return _dumps(result)
 
     except Exception as e:
         result = {
@@ -846,7 +1059,7 @@ async def execute_bash(command: str, timeout: int = 30) -> str:
             "command": command,
         }
         log_operation("execute_bash_error", {"command": command, "error": str(e)})
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        return _dumps(result)
 
 
 @mcp.tool()
@@ -869,7 +1082,7 @@ async def read_code_mem(file_paths: List[str]) -> str:
             log_operation(
                 "read_code_mem_error", {"error": "missing_or_invalid_file_paths"}
             )
-            return json.dumps(result, ensure_ascii=False, indent=2)
+            return _dumps(result)
 
         # Remove duplicates while preserving order
         unique_file_paths = list(dict.fromkeys(file_paths))
@@ -892,11 +1105,10 @@ async def read_code_mem(file_paths: List[str]) -> str:
                 "read_code_mem",
                 {"file_paths": unique_file_paths, "status": "no_summary_file"},
             )
-            return json.dumps(result, ensure_ascii=False, indent=2)
+            return _dumps(result)
 
-        # Read the summary file
-        with open(summary_file_path, "r", encoding="utf-8") as f:
-            summary_content = f.read()
+        # Read the summary file (parsed sections are cached until it changes)
+        summary_content, summary_sections = _load_summary(summary_file_path)
 
         if not summary_content.strip():
             result = {
@@ -909,7 +1121,7 @@ async def read_code_mem(file_paths: List[str]) -> str:
                 "read_code_mem",
                 {"file_paths": unique_file_paths, "status": "empty_summary"},
             )
-            return json.dumps(result, ensure_ascii=False, indent=2)
+            return _dumps(result)
 
         # Process each file path and collect results
         results = []
@@ -918,7 +1130,7 @@ async def read_code_mem(file_paths: List[str]) -> str:
         for file_path in unique_file_paths:
             # Extract file-specific section from summary
             file_section = _extract_file_section_from_summary(
-                summary_content, file_path
+                summary_content, file_path, summary_sections
             )
 
             if file_section:
@@ -966,7 +1178,7 @@ async def read_code_mem(file_paths: List[str]) -> str:
             },
         )
 
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        return _dumps(result)
 
     except Exception as e:
         result = {
@@ -980,11 +1192,67 @@ async def read_code_mem(file_paths: List[str]) -> str:
         log_operation(
             "read_code_mem_error", {"file_paths": file_paths, "error": str(e)}
         )
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        return _dumps(result)
+
+
+# Pattern to match implementation sections with separator lines
+SUMMARY_SECTION_PATTERN = re.compile(
+    r"={80}\s*\n## IMPLEMENTATION File ([^;]+); ROUND \d+\s*\n={80}(.*?)(?=\n={80}|\Z)",
+    re.DOTALL,
+)
+
+
+def _parse_summary_sections(summary_content: str) -> List[tuple]:
+    """
+    Parse the implementation sections of the summary content
+
+    Returns:
+        List of (file_path, normalized_file_path, section_content) tuples
+    """
+    sections = []
+    for file_path_in_summary, section_content in SUMMARY_SECTION_PATTERN.findall(
+        summary_content
+    ):
+        file_path_in_summary = file_path_in_summary.strip()
+        sections.append(
+            (
+                file_path_in_summary,
+                _normalize_file_path(file_path_in_summary),
+                section_content,
+            )
+        )
+    return sections
+
+
+# Last loaded summary file: ((path, mtime_ns, size), content, sections)
+_SUMMARY_CACHE = None
+
+
+def _load_summary(summary_file_path: Path):
+    """
+    Read and parse the summary file, reusing the cached copy while unchanged
+
+    Returns:
+        (summary_content, sections) tuple, sections as from _parse_summary_sections
+    """
+    global _SUMMARY_CACHE
+    stat_result = os.stat(summary_file_path)
+    cache_key = (str(summary_file_path), stat_result.st_mtime_ns, stat_result.st_size)
+
+    if _SUMMARY_CACHE is None or _SUMMARY_CACHE[0] != cache_key:
+        with open(summary_file_path, "r", encoding="utf-8") as f:
+            summary_content = f.read()
+        _SUMMARY_CACHE = (
+            cache_key,
+            summary_content,
+            _parse_summary_sections(summary_content),
+        )
+
+    return _SUMMARY_CACHE[1], _SUMMARY_CACHE[2]
 
 
 def _extract_file_section_from_summary(
-    summary_content: str, target_file_path: str
+    summary_content: str, target_file_path: str, sections: List[tuple] = None
 ) -> str:
     """
     Extract the specific section for a file from the summary content
@@ -992,27 +1260,18 @@ def _extract_file_section_from_summary(
     Args:
         summary_content: Full summary content
         target_file_path: Path of the target file
+        sections: Sections already parsed by _parse_summary_sections (optional)
 
     Returns:
         File-specific section or None if not found
     """
-    import re
+    if sections is None:
+        sections = _parse_summary_sections(summary_content)
 
     # Normalize the target path for comparison
     normalized_target = _normalize_file_path(target_file_path)
 
-    # Pattern to match implementation sections with separator lines
-    section_pattern = r"={80}\s*\n## IMPLEMENTATION File ([^;]+); ROUND \d+\s*\n={80}(.*?)(?=\n={80}|\Z)"
-
-    matches = re.findall(section_pattern, summary_content, re.DOTALL)
-
-    for file_path_in_summary, section_content in matches:
-        file_path_in_summary = file_path_in_summary.strip()
-        section_content = section_content.strip()
-
-        # Normalize the path from summary for comparison
-        normalized_summary_path = _normalize_file_path(file_path_in_summary)
-
+    for file_path_in_summary, normalized_summary_path, section_content in sections:
         # Check if paths match using multiple strategies
         if _paths_match(
             normalized_target,
@@ -1020,6 +1279,8 @@ def _extract_file_section_from_summary(
             target_file_path,
             file_path_in_summary,
         ):
+            section_content = section_content.strip()
+
             # Return the complete section with proper formatting
             file_section = f"""================================================================================
 ## IMPLEMENTATION File {file_path_in_summary}; ROUND [X]
@@ -1035,6 +1296,7 @@ def _extract_file_section_from_summary(
     return _extract_file_section_alternative(summary_content, target_file_path)
 
 
+@functools.lru_cache(maxsize=1024)
 def _normalize_file_path(file_path: str) -> str:
     """Normalize file path for comparison"""
     # Remove leading/trailing slashes and convert to lowercase
@@ -1111,15 +1373,24 @@ def _extract_file_section_alternative(
     # Get the basename for fallback matching
     target_basename = os.path.basename(target_file_path)
 
-    # Split by separator lines to get individual sections
-    sections = summary_content.split("=" * 80)
+    # Walk the sections between separator lines by offset instead of
+    # splitting the whole summary into a list of substrings
+    separator = "=" * 80
+    header_marker = "## IMPLEMENTATION File"
+    content_length = len(summary_content)
+
+    def section_end(start: int) -> int:
+        end = summary_content.find(separator, start)
+        return content_length if end == -1 else end
 
-    for i, section in enumerate(sections):
-        if "## IMPLEMENTATION File" in section:
+    start = 0
+    end = section_end(start)
+    while True:
+        if summary_content.find(header_marker, start, end) != -1:
             # Extract the file path from the header
-            lines = section.strip().split("\n")
+            lines = summary_content[start:end].strip().split("\n")
             for line in lines:
-                if "## IMPLEMENTATION File" in line:
+                if header_marker in line:
                     # Extract file path between "File " and "; ROUND"
                     try:
                         file_part = line.split("File ")[1].split("; ROUND")[0].strip()
@@ -1133,8 +1404,11 @@ def _extract_file_section_alternative(
                             or file_part.endswith(target_file_path)
                         ):
                             # Get the next section which contains the content
-                            if i + 1 < len(sections):
-                                content_section = sections[i + 1].strip()
+                            if end < content_length:
+                                next_start = end + len(separator)
+                                content_section = summary_content[
+                                    next_start : section_end(next_start)
+                                ].strip()
                                 return f"""================================================================================
 ## IMPLEMENTATION File {file_part}
 ================================================================================
@@ -1146,11 +1420,126 @@ def _extract_file_section_alternative(
                     except (IndexError, AttributeError):
                         continue
 
+        if end >= content_length:
+            break
+        start = end + len(separator)
+        end = section_end(start)
+
     return None
 
 
 # ==================== Code Search Tools ====================
 
+# Maximum number of match records returned by search_code
+MAX_SEARCH_MATCHES = 50
+
+# Worker threads used by search_code to read files in parallel
+SEARCH_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Files search_code keeps queued on the pool at once, so a large workspace
+# is not turned into one pending future per file up front
+SEARCH_MAX_PENDING = SEARCH_MAX_WORKERS * 2
+
+# Shared worker pool for search_code, created on first use
+_SEARCH_EXECUTOR = None
+
+
+def _get_search_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """Get the shared thread pool used to search files"""
+    global _SEARCH_EXECUTOR
+    if _SEARCH_EXECUTOR is None:
+        _SEARCH_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+            max_workers=SEARCH_MAX_WORKERS, thread_name_prefix="search"
+        )
+    return _SEARCH_EXECUTOR
+
+
+def _search_file(
+    file_path: str,
+    search_path: Path,
+    line_matches,
+    match_type: str,
+    required_substring: str = None,
+):
+    """
+    Search a single file line by line
+
+    Args:
+        file_path: Path of the file to search
+        search_path: Directory that match paths are reported relative to
+        line_matches: Callable returning True for a matching line
+        match_type: Match type recorded in each match
+        required_substring: Lowercase substring the file must contain (optional)
+
+    Returns:
+        (total_matches, matches) tuple with at most MAX_SEARCH_MATCHES
+        match records, or None if the file could not be read
+    """
+    try:
+        with open(file_path, "r", encoding="utf-8") as f:
+            content = f.read()
+    except Exception as e:
+        logger.warning(f"Error searching file {file_path}: {e}")
+        return None
+
+    # Skip the per-line scan when the file cannot contain the substring
+    if required_substring is not None and required_substring not in content.lower():
+        return 0, []
+
+    relative_path = os.path.relpath(file_path, search_path)
+    total_matches = 0
+    matches = []
+
+    for line_num, line in enumerate(io.StringIO(content), 1):
+        if line_matches(line):
+            total_matches += 1
+            # Only keep the records that can be returned
+            if len(matches) < MAX_SEARCH_MATCHES:
+                matches.append(
+                    {
+                        "file": relative_path,
+                        "line_number": line_num,
+                        "line_content": line.strip(),
+                        "match_type": match_type,
+                    }
+                )
+
+    return total_matches, matches
+
+
+def _iter_matching_files(directory: str, file_pattern: str):
+    """
+    Recursively yield files whose names match file_pattern
+
+    Walks with os.scandir and follows the same rules as a recursive
+    glob of ``directory/**/file_pattern``: hidden entries are skipped
+    unless the pattern itself starts with a dot.
+    """
+    match_hidden = file_pattern.startswith(".")
+    subdirectories = []
+
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                hidden = entry.name.startswith(".")
+                try:
+                    if entry.is_dir():
+                        if not hidden:
+                            subdirectories.append(entry.path)
+                        continue
+                except OSError:
+                    continue
+
+                if (match_hidden or not hidden) and fnmatch.fnmatch(
+                    entry.name, file_pattern
+                ):
+                    yield entry.path
+    except OSError:
+        return
+
+    for subdirectory in subdirectories:
+        yield from _iter_matching_files(subdirectory, file_pattern)
+
 
 @mcp.tool()
 async def search_code(
@@ -1192,49 +1581,78 @@ async def search_code(
                 "message": f"Search directory不存在: {search_path}",
                 "pattern": pattern,
             }
-            return json.dumps(result, ensure_ascii=False, indent=2)
-
-        import glob
+            return _dumps(result)
 
         # Get matching files
-        file_paths = glob.glob(str(search_path / "**" / file_pattern), recursive=True)
-
-        matches = []
-        total_files_searched = 0
+        if "/" in file_pattern or os.sep in file_pattern:
+            file_paths = glob.iglob(
+                str(search_path / "**" / file_pattern), recursive=True
+            )
+        else:
+            file_paths = _iter_matching_files(str(search_path), file_pattern)
+
+        # Prepare the matcher once instead of per line
+        if use_regex:
+            compiled_pattern = re.compile(pattern)
+            search_file = functools.partial(
+                _search_file,
+                search_path=search_path,
+                line_matches=lambda line: compiled_pattern.search(line) is not None,
+                match_type="regex",
+            )
+        else:
+            lowered_pattern = pattern.lower()
+            search_file = functools.partial(
+                _search_file,
+                search_path=search_path,
+                line_matches=lambda line: lowered_pattern in line.lower(),
+                match_type="substring",
+                required_substring=lowered_pattern,
+            )
 
-        for file_path in file_paths:
-            try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    lines = f.readlines()
+        # The pool is created here, on the event loop, so concurrent
+        # searches cannot race to create it
+        executor = _get_search_executor()
+
+        def collect_matches():
+            """
+            Read and scan files in parallel, merging results in walk order
+
+            At most SEARCH_MAX_PENDING files are queued at a time, so the
+            walk stays lazy instead of being drained into futures up front
+            """
+            matches = []
+            total_matches = 0
+            total_files_searched = 0
+            pending = collections.deque()
+            file_paths_iter = iter(file_paths)
+
+            while True:
+                for file_path in itertools.islice(
+                    file_paths_iter, SEARCH_MAX_PENDING - len(pending)
+                ):
+                    pending.append(executor.submit(search_file, file_path))
+                if not pending:
+                    break
+
+                file_result = pending.popleft().result()
+                if file_result is None:
+                    continue
 
+                file_total, file_matches = file_result
                 total_files_searched += 1
-                relative_path = os.path.relpath(file_path, search_path)
+                total_matches += file_total
+                remaining = MAX_SEARCH_MATCHES - len(matches)
+                if remaining > 0:
+                    matches.extend(file_matches[:remaining])
 
-                for line_num, line in enumerate(lines, 1):
-                    if use_regex:
-                        if re.search(pattern, line):
-                            matches.append(
-                                {
-                                    "file": relative_path,
-                                    "line_number": line_num,
-                                    "line_content": line.strip(),
-                                    "match_type": "regex",
-                                }
-                            )
-                    else:
-                        if pattern.lower() in line.lower():
-                            matches.append(
-                                {
-                                    "file": relative_path,
-                                    "line_number": line_num,
-                                    "line_content": line.strip(),
-                                    "match_type": "substring",
-                                }
-                            )
+            return matches, total_matches, total_files_searched
 
-            except Exception as e:
-                logger.warning(f"Error searching file {file_path}: {e}")
-                continue
+        # The walk and the merge run in a worker thread so other tool calls
+        # are served meanwhile
+        matches, total_matches, total_files_searched = await asyncio.to_thread(
+            collect_matches
+        )
 
         result = {
             "status": "success",
@@ -1242,13 +1660,13 @@ async def search_code(
             "file_pattern": file_pattern,
             "use_regex": use_regex,
             "search_directory": str(search_path),
-            "total_matches": len(matches),
+            "total_matches": total_matches,
             "total_files_searched": total_files_searched,
-            "matches": matches[:50],  # 限制返回前50个匹配
+            "matches": matches,  # 限制返回前50个匹配
         }
 
-        if len(matches) > 50:
-            result["note"] = f"显示前50个匹配，总共找到{len(matches)}个匹配"
+        if total_matches > MAX_SEARCH_MATCHES:
+            result["note"] = f"显示前50个匹配，总共找到{total_matches}个匹配"
 
         log_operation(
             "search_code",
@@ -1257,12 +1675,12 @@ async def search_code(
                 "file_pattern": file_pattern,
                 "use_regex": use_regex,
                 "search_directory": str(search_path),
-                "total_matches": len(matches),
+                "total_matches": total_matches,
                 "files_searched": total_files_searched,
             },
         )
 
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        return _dumps(result)
 
     except Exception as e:
         result = {
@@ -1271,20 +1689,72 @@ async def search_code(
             "pattern": pattern,
         }
         log_operation("search_code_error", {"pattern": pattern, "error": str(e)})
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        return _dumps(result)
 
 
 # ==================== File Structure Tools ====================
 
 
+# Parallelize get_file_structure when the top level has more subdirectories
+PARALLEL_SCAN_MIN_SUBDIRS = 4
+
+# Directories get_file_structure does not descend into by default (hidden
+# directories are always skipped)
+_IGNORED_DIRS = frozenset(
+    {
+        ".git",
+        ".hg",
+        ".svn",
+        "__pycache__",
+        "node_modules",
+        ".venv",
+        "venv",
+        ".mypy_cache",
+        ".pytest_cache",
+    }
+)
+
+# Worker threads used by get_file_structure to scan subdirectories in parallel
+SCAN_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Shared worker pool for directory scans, created on first use
+_SCAN_EXECUTOR = None
+
+
+def _get_scan_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """Get the shared thread pool used to scan subdirectories"""
+    global _SCAN_EXECUTOR
+    if _SCAN_EXECUTOR is None:
+        _SCAN_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+            max_workers=SCAN_MAX_WORKERS, thread_name_prefix="scan"
+        )
+    return _SCAN_EXECUTOR
+
+
+def _file_extension(name: str) -> str:
+    """File extension of a name, matching pathlib's Path.suffix"""
+    i = name.rfind(".")
+    return name[i:] if 0 < i < len(name) - 1 else ""
+
+
 @mcp.tool()
-async def get_file_structure(directory: str = ".", max_depth: int = 5) -> str:
+async def get_file_structure(
+    directory: str = ".",
+    max_depth: int = 5,
+    include_sizes: bool = True,
+    include_empty_files: bool = False,
+    ignore_dirs: List[str] = None,
+) -> str:
     """
     Get directory file structure
 
     Args:
         directory: Directory path, relative to workspace
         max_depth: 最大遍历深度
+        include_sizes: Whether to stat files for size_bytes (False lists names only)
+        include_empty_files: Whether to also return the paths of zero-byte files
+        ignore_dirs: Directory names to skip (defaults to VCS, cache and
+            dependency directories such as node_modules)
 
     Returns:
         JSON string of file structure
@@ -1302,80 +1772,171 @@ async def get_file_structure(directory: str = ".", max_depth: int = 5) -> str:
                 "status": "error",
                 "message": f"Directory does not exist: {directory}",
             }
-            return json.dumps(result, ensure_ascii=False, indent=2)
+            return _dumps(result)
+
+        # Entries below the workspace share its path as a prefix, so
+        # relative paths are a string slice rather than a relpath() each
+        workspace_prefix = str(WORKSPACE_DIR).rstrip(os.sep) + os.sep
+
+        ignored_dirs = _IGNORED_DIRS if ignore_dirs is None else frozenset(ignore_dirs)
+
+        # Zero-byte files seen during the walk, so callers that want them do
+        # not need a second traversal (list.append is safe across the pool)
+        empty_files = []
+
+        def relative_to_workspace(path: str) -> str:
+            if path.startswith(workspace_prefix):
+                return path[len(workspace_prefix) :]
+            return os.path.relpath(path, WORKSPACE_DIR)
+
+        # The pool is created here, on the event loop, so concurrent scans
+        # cannot race to create it from their worker threads
+        executor = _get_scan_executor()
+
+        def scan_directory(path: str, name: str, current_depth: int = 0):
+            """
+            Recursively scan directory
 
-        def scan_directory(path: Path, current_depth: int = 0) -> Dict[str, Any]:
-            """Recursively scan directory"""
+            Returns:
+                (node, file_count, directory_count) tuple, where the counts
+                include the node itself and everything below it
+            """
+            # Only reached for the root; subdirectories at the depth cap are
+            # turned into truncated nodes by the caller without recursing
             if current_depth >= max_depth:
-                return {"type": "directory", "name": path.name, "truncated": True}
+                return {"type": "directory", "name": name, "truncated": True}, 0, 1
 
             items = []
+            file_count = 0
+            directory_count = 1
+            pending = []
             try:
-                for item in sorted(path.iterdir()):
-                    relative_path = os.path.relpath(item, WORKSPACE_DIR)
+                # DirEntry caches the type and stat info from the directory
+                # listing, so is_file/is_dir/stat do not each hit the disk
+                with os.scandir(path) as entries:
+                    sorted_entries = sorted(entries, key=lambda entry: entry.name)
+
+                # Scan top-level subdirectories in parallel when there are several
+                parallel = (
+                    current_depth == 0
+                    and max_depth > 1
+                    and sum(
+                        1
+                        for entry in sorted_entries
+                        if entry.is_dir()
+                        and entry.name not in ignored_dirs
+                        and not entry.name.startswith(".")
+                    )
+                    > PARALLEL_SCAN_MIN_SUBDIRS
+                )
+
+                for entry in sorted_entries:
+                    relative_path = relative_to_workspace(entry.path)
 
-                    if item.is_file():
+                    if entry.is_file():
                         file_info = {
                             "type": "file",
-                            "name": item.name,
+                            "name": entry.name,
                             "path": relative_path,
-                            "size_bytes": item.stat().st_size,
-                            "extension": item.suffix,
                         }
+                        # Sizes need a stat per file; the listing alone has none
+                        if include_sizes or include_empty_files:
+                            size_bytes = entry.stat().st_size
+                            if include_sizes:
+                                file_info["size_bytes"] = size_bytes
+                            if include_empty_files and size_bytes == 0:
+                                empty_files.append(relative_path)
+                        file_info["extension"] = _file_extension(entry.name)
                         items.append(file_info)
-                    elif item.is_dir() and not item.name.startswith("."):
-                        dir_info = scan_directory(item, current_depth + 1)
+                        file_count += 1
+                    elif (
+                        entry.is_dir()
+                        and entry.name not in ignored_dirs
+                        and not entry.name.startswith(".")
+                    ):
+                        # The listing already says this is a directory, so at the
+                        # depth cap the node comes straight from the DirEntry and
+                        # the subtree is never opened
+                        if current_depth + 1 >= max_depth:
+                            items.append(
+                                {
+                                    "type": "directory",
+                                    "name": entry.name,
+                                    "truncated": True,
+                                    "path": relative_path,
+                                }
+                            )
+                            directory_count += 1
+                            continue
+
+                        if parallel:
+                            future = executor.submit(
+                                scan_directory,
+                                entry.path,
+                                entry.name,
+                                current_depth + 1,
+                            )
+                            pending.append((len(items), future, relative_path))
+                            items.append(None)
+                            continue
+
+                        dir_info, sub_files, sub_directories = scan_directory(
+                            entry.path, entry.name, current_depth + 1
+                        )
                         dir_info["path"] = relative_path
                         items.append(dir_info)
+                        file_count += sub_files
+                        directory_count += sub_directories
             except PermissionError:
                 pass
 
-            return {
+            # Fill in the parallel results in sorted order
+            for index, future, relative_path in pending:
+                dir_info, sub_files, sub_directories = future.result()
+                dir_info["path"] = relative_path
+                items[index] = dir_info
+                file_count += sub_files
+                directory_count += sub_directories
+
+            node = {
                 "type": "directory",
-                "name": path.name,
+                "name": name,
                 "items": items,
                 "item_count": len(items),
             }
+            return node, file_count, directory_count
 
-        structure = scan_directory(target_dir)
-
-        # 统计信息
-        def count_items(node):
-            if node["type"] == "file":
-                return {"files": 1, "directories": 0}
-            else:
-                counts = {"files": 0, "directories": 1}
-                for item in node.get("items", []):
-                    item_counts = count_items(item)
-                    counts["files"] += item_counts["files"]
-                    counts["directories"] += item_counts["directories"]
-                return counts
-
-        counts = count_items(structure)
+        # Files and directories are counted during the scan itself. The walk
+        # runs in a worker thread so other tool calls are served meanwhile
+        structure, total_files, total_directories = await asyncio.to_thread(
+            scan_directory, str(target_dir), target_dir.name
+        )
 
         result = {
             "status": "success",
             "directory": directory,
             "max_depth": max_depth,
+            "include_sizes": include_sizes,
             "structure": structure,
             "summary": {
-                "total_files": counts["files"],
-                "total_directories": counts["directories"]
-                - 1,  # Exclude root directory
+                "total_files": total_files,
+                "total_directories": total_directories - 1,  # Exclude root directory
             },
         }
+        if include_empty_files:
+            result["empty_files"] = sorted(empty_files)
 
         log_operation(
             "get_file_structure",
             {
                 "directory": directory,
                 "max_depth": max_depth,
-                "total_files": counts["files"],
-                "total_directories": counts["directories"] - 1,
+                "total_files": total_files,
+                "total_directories": total_directories - 1,
             },
         )
 
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        return _dumps(result)
 
     except Exception as e:
         result = {
@@ -1386,12 +1947,22 @@ async def get_file_structure(directory: str = ".", max_depth: int = 5) -> str:
         log_operation(
             "get_file_structure_error", {"directory": directory, "error": str(e)}
         )
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        return _dumps(result)
 
 
 # ==================== Workspace Management Tools ====================
 
 
+def _create_workspace_dir(workspace_path: str) -> Path:
+    """Resolve the workspace path and create the directory (if it does not exist)"""
+    new_workspace = os.path.realpath(workspace_path)
+    # The workflow re-sets an existing workspace; one stat answers that case
+    # where mkdir would fail with EEXIST and then stat anyway
+    if not os.path.isdir(new_workspace):
+        os.makedirs(new_workspace, exist_ok=True)
+    return Path(new_workspace)
+
+
 @mcp.tool()
 async def set_workspace(workspace_path: str) -> str:
     """
@@ -1408,10 +1979,7 @@ async def set_workspace(workspace_path: str) -> str:
     """
     try:
         global WORKSPACE_DIR
-        new_workspace = Path(workspace_path).resolve()
-
-        # Create directory (if it does not exist)
-        new_workspace.mkdir(parents=True, exist_ok=True)
+        new_workspace = await asyncio.to_thread(_create_workspace_dir, workspace_path)
 
         old_workspace = WORKSPACE_DIR
         WORKSPACE_DIR = new_workspace
@@ -1433,7 +2001,7 @@ async def set_workspace(workspace_path: str) -> str:
             },
         )
 
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        return _dumps(result)
 
     except Exception as e:
         result = {
@@ -1444,7 +2012,7 @@ async def set_workspace(workspace_path: str) -> str:
         log_operation(
             "set_workspace_error", {"workspace_path": workspace_path, "error": str(e)}
         )
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        return _dumps(result)
 
 
 @mcp.tool()
@@ -1459,9 +2027,13 @@ async def get_operation_history(last_n: int = 10) -> str:
         JSON string of operation history
     """
     try:
-        recent_history = (
-            OPERATION_HISTORY[-last_n:] if last_n > 0 else OPERATION_HISTORY
-        )
+        # Copy only the requested tail of the bounded history, walking it
+        # from the newest end so the cost is O(last_n)
+        if last_n > 0:
+            recent_history = list(itertools.islice(reversed(OPERATION_HISTORY), last_n))
+            recent_history.reverse()
+        else:
+            recent_history = list(OPERATION_HISTORY)
 
         result = {
             "status": "success",
@@ -1471,14 +2043,14 @@ async def get_operation_history(last_n: int = 10) -> str:
             "history": recent_history,
         }
 
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        return _dumps(result)
 
     except Exception as e:
         result = {
             "status": "error",
             "message": f"Failed to get operation history: {str(e)}",
         }
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        return _dumps(result)
 
 
 # ==================== Server Initialization ====================
@@ -1500,7 +2072,9 @@ def main():
     print("  • execute_python      - Execute Python code / Execute Python code")
     print("  • execute_bash        - Execute bash command / Execute bash commands")
     print("  • search_code         - Search code patterns / Search code patterns")
-    print("  • get_file_structure  - Get file structure / Get file structure")
+    print(
+        "  • get_file_structure  - Get file structure (include_sizes=False skips file stats) / Get file structure"
+    )
     print("  • set_workspace       - Set workspace / Set workspace")
     print("  • get_operation_history - Get operation history / Get operation history")
     print("")